@@ -13,4 +13,53 @@ async def create_table():
     ''')
     await conn.close()
 
+async def create_users_notify_trigger():
+    """
+    Триггер на таблице users: при любом изменении строки отправляет NOTIFY
+    в канал users_changed с ID пользователя. Приложение слушает этот канал
+    и сбрасывает кэш ответов GET /users/{user_id}
+    """
+    conn = await asyncpg.connect(DATABASE_URL)
+    await conn.execute('''
+        CREATE OR REPLACE FUNCTION notify_users_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('users_changed', OLD.id::text);
+            ELSE
+                PERFORM pg_notify('users_changed', NEW.id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS users_changed ON users;
+        CREATE TRIGGER users_changed
+            AFTER INSERT OR UPDATE OR DELETE ON users
+            FOR EACH ROW EXECUTE FUNCTION notify_users_changed();
+    ''')
+    await conn.close()
+
+async def create_user_function():
+    """
+    Функция create_user_fn создает пользователя на стороне сервера.
+    Все связанные записи (аудит, журнал и т.п.) добавляются в ее тело и выполняются
+    за одно обращение к БД. PL/pgSQL кэширует планы своих запросов в сессии
+    """
+    conn = await asyncpg.connect(DATABASE_URL)
+    await conn.execute('''
+        CREATE OR REPLACE FUNCTION create_user_fn(p_username text, p_email text) RETURNS users AS $$
+        DECLARE
+            new_user users;
+        BEGIN
+            INSERT INTO users (username, email)
+            VALUES (p_username, p_email)
+            RETURNING * INTO new_user;
+            RETURN new_user;
+        END;
+        $$ LANGUAGE plpgsql;
+    ''')
+    await conn.close()
+
 #asyncio.run(create_table())
+#asyncio.run(create_users_notify_trigger())
+#asyncio.run(create_user_function())
@@ -1,5 +1,18 @@
 import re
-from pydantic import BaseModel, EmailStr, Field, field_validator, conint
+import msgspec
+from typing import Annotated
+from pydantic import AfterValidator, BaseModel, Field, field_validator, conint
+
+# Простая проверка формата email вместо EmailStr: пакет email-validator
+# нормализует Unicode и проверяет домен, что заметно дороже для каждого запроса
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+def _email_ok(value: str) -> str:
+    if not _EMAIL.fullmatch(value):
+        raise ValueError("Некорректный адрес электронной почты")
+    return value
+
+Email = Annotated[str, AfterValidator(_email_ok)]
 
 # Базовый класс для моделей пользователя - содержит общие поля
 class UserBase(BaseModel):
@@ -46,6 +59,21 @@ class Todo(BaseModel):
 class TodoReturn(Todo):
     id: int
 
+# Структуры msgspec для горячих путей чтения: строка из БД сразу кодируется в JSON
+# через MsgspecResponse без валидации Pydantic. Pydantic-модели UserReturn и TodoReturn
+# остаются для документации (response_model) и остальных обработчиков.
+# Порядок полей совпадает с порядком столбцов в SELECT
+class UserOut(msgspec.Struct):
+    id: int
+    username: str
+    email: str
+
+class TodoOut(msgspec.Struct):
+    id: int
+    title: str
+    description: str
+    is_complited: bool
+
 class Item(BaseModel):
     name: str
 
@@ -62,9 +90,12 @@ class UserCreate(BaseModel):
     is_subscribed: bool | None = Field(default=False)
 '''
 class Contact(BaseModel):
-    email: EmailStr
+    email: Email
     phone: str | None = Field(default=None, pattern=r'^\d{7,15}$')
 
+# Регулярное выражение компилируется один раз при импорте, а не на каждый запрос
+_BAD_WORDS = re.compile(r'редиск[а-я]|бяк[а-я]|козявк[а-я]', re.IGNORECASE)
+
 class Feedback(BaseModel):
     name: str = Field(min_length=2, max_length=50)
     message: str = Field(min_length=10, max_length=500)
@@ -73,7 +104,7 @@ class Feedback(BaseModel):
     @field_validator('message', mode='after')
     @classmethod
     def validate_message(cls, data : str):
-        pattern = r'(?i)редиск[а-я]|бяк[а-я]|козявк[а-я]'
-        if re.findall(pattern, data):
+        # search останавливается на первом совпадении, findall собирал бы список всех
+        if _BAD_WORDS.search(data):
             raise ValueError("Использование недопустимых слов")
         return data
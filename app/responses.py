@@ -0,0 +1,12 @@
+import msgspec
+from fastapi.responses import JSONResponse
+
+
+class MsgspecResponse(JSONResponse):
+    """
+    JSON-ответ, который кодируется через msgspec (на C, без обхода полей на Python).
+    Понимает обычные словари и списки, а также структуры msgspec.Struct.
+    """
+
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
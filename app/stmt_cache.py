@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import asyncpg
+
+
+class UnpreparedStatement:
+    """
+    Запрос с тем же интерфейсом, что у PreparedStatement, но без именованного prepare.
+    Каждый вызов идет через conn.fetch*/executemany: при statement_cache_size=0 asyncpg
+    отправляет безымянный запрос, и PostgreSQL планирует его с фактическими значениями
+    параметров. Нужен за PgBouncer в режиме пулинга транзакций, где именованные
+    запросы ломаются ("prepared statement already exists")
+    """
+    __slots__ = ('_conn', '_sql')
+
+    def __init__(self, conn: asyncpg.Connection, sql: str):
+        self._conn = conn
+        self._sql = sql
+
+    async def fetch(self, *args):
+        return await self._conn.fetch(self._sql, *args)
+
+    async def fetchrow(self, *args):
+        return await self._conn.fetchrow(self._sql, *args)
+
+    async def fetchval(self, *args, column: int = 0):
+        return await self._conn.fetchval(self._sql, *args, column=column)
+
+    async def executemany(self, args):
+        return await self._conn.executemany(self._sql, args)
+
+
+class StmtCache:
+    """
+    LRU-кэш подготовленных (prepared) запросов одного соединения.
+
+    Ключ - текст SQL-запроса: строка хэшируется один раз и CPython запоминает хэш,
+    поэтому повторный поиск по константе-запросу стоит как обычный поиск в словаре.
+    Запрос разбирается и планируется в PostgreSQL только при первом обращении.
+
+    При max_size=0 кэш отключен и get возвращает UnpreparedStatement.
+    """
+
+    def __init__(self, max_size: int = 500):
+        self._stmts: OrderedDict[str, asyncpg.prepared_stmt.PreparedStatement] = OrderedDict()
+        self.max_size = max_size
+
+    async def get(self, conn: asyncpg.Connection, sql: str):
+        if not self.max_size:
+            return UnpreparedStatement(conn, sql)
+        stmt = self._stmts.get(sql)
+        if stmt is None:
+            stmt = await conn.prepare(sql)
+            self._stmts[sql] = stmt
+            # Самый давно не используемый запрос вытесняется, asyncpg закроет его на сервере
+            if len(self._stmts) > self.max_size:
+                self._stmts.popitem(last=False)
+        else:
+            self._stmts.move_to_end(sql)
+        return stmt
+
+    def __len__(self):
+        return len(self._stmts)